@@ -12,11 +12,11 @@ from elaunira.airflow.providers.r2index.operators.r2index import (
     R2IndexUploadOperator,
     UploadItem,
 )
-from elaunira.r2index.storage import R2TransferConfig
-
 if TYPE_CHECKING:
     from airflow.sdk.bases.decorator import TaskDecorator
 
+    from elaunira.r2index.storage import R2TransferConfig
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -103,10 +103,8 @@ class _R2IndexUploadDecoratedOperator(R2IndexUploadOperator):
         self.python_callable = python_callable
         self.op_args = op_args or []
         self.op_kwargs = op_kwargs or {}
-        # items will be set in execute()
-        kwargs["items"] = []
-        kwargs["transfer_config"] = transfer_config
-        super().__init__(**kwargs)
+        # items are produced by the callable in execute()
+        super().__init__(transfer_config=transfer_config, **kwargs)
 
     def execute(self, context: Any) -> list[dict[str, Any]]:
         """Execute the decorated function and upload the result."""
@@ -132,10 +130,8 @@ class _R2IndexDownloadDecoratedOperator(R2IndexDownloadOperator):
         self.python_callable = python_callable
         self.op_args = op_args or []
         self.op_kwargs = op_kwargs or {}
-        # items will be set in execute()
-        kwargs["items"] = []
-        kwargs["transfer_config"] = transfer_config
-        super().__init__(**kwargs)
+        # items are produced by the callable in execute()
+        super().__init__(transfer_config=transfer_config, **kwargs)
 
     def execute(self, context: Any) -> list[dict[str, Any]]:
         """Execute the decorated function and download the result."""
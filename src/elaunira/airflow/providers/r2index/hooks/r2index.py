@@ -2,15 +2,72 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
-from typing import TYPE_CHECKING, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from airflow.sdk.bases.hook import BaseHook
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 if TYPE_CHECKING:
     from elaunira.r2index import R2IndexClient
 
+# Resolved configs and Vault secrets cached with a shared monotonic TTL, so
+# repeated operator runs in the same worker process skip the connection
+# lookup (and any Vault round trips) while still picking up rotations.
+_CONFIG_CACHE_TTL_SECONDS = 300.0
+_config_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_vault_secret_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+
+def _resolve_config(conn_id: str) -> dict[str, Any]:
+    """Resolve client configuration for a conn_id, with a short-lived cache.
+
+    Uses the hook's priority chain (connection -> Vault -> environment) and
+    caches the result for ``_CONFIG_CACHE_TTL_SECONDS`` keyed on conn_id.
+    Incomplete resolutions (no ``index_api_url``, e.g. during a metadata-DB
+    or Vault outage) are returned but never cached, so the next call retries.
+    """
+    now = time.monotonic()
+    cached = _config_cache.get(conn_id)
+    if cached is not None and now - cached[0] < _CONFIG_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    hook = R2IndexHook(r2index_conn_id=conn_id)
+    config = hook._get_config_from_connection()
+    if config is None or not config.get("index_api_url"):
+        config = hook._get_config_from_env()
+    config = config or {}
+    if config.get("index_api_url"):
+        _config_cache[conn_id] = (now, config)
+    return config
+
+
+def _read_vault_secret(vault_conn_id: str, path: str) -> dict[str, Any]:
+    """Read one secret path from Vault/OpenBao, cached per (conn_id, path).
+
+    Config keys sharing a path#key prefix resolve to a single KV read per
+    TTL window instead of one per hook instantiation; the expiry keeps
+    rotated credentials from outliving ``_CONFIG_CACHE_TTL_SECONDS``.
+    """
+    now = time.monotonic()
+    cached = _vault_secret_cache.get((vault_conn_id, path))
+    if cached is not None and now - cached[0] < _CONFIG_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    from airflow.providers.hashicorp.hooks.vault import VaultHook
+
+    vault_hook = VaultHook(vault_conn_id=vault_conn_id)
+    data = vault_hook.get_secret(secret_path=path, secret_version=None) or {}
+    _vault_secret_cache[(vault_conn_id, path)] = (now, data)
+    return data
+
 
 class R2IndexHook(BaseHook):
     """
@@ -73,6 +130,12 @@ class R2IndexHook(BaseHook):
         "r2_endpoint_url",
     ]
 
+    # Clients pooled per conn_id across hook instances, so transient hooks
+    # share one underlying HTTP session per process. Each entry remembers
+    # the resolved config it was built from so a rotation replaces the
+    # client instead of serving stale credentials.
+    _clients: ClassVar[dict[str, tuple[frozenset, R2IndexClient]]] = {}
+
     @classmethod
     def get_ui_field_behaviour(cls) -> dict[str, Any]:
         """Customize connection form UI."""
@@ -137,7 +200,6 @@ class R2IndexHook(BaseHook):
     def __init__(self, r2index_conn_id: str = default_conn_name) -> None:
         super().__init__()
         self.r2index_conn_id = r2index_conn_id
-        self._client: R2IndexClient | None = None
 
     def _parse_secret_ref(self, secret_ref: str, default_key: str) -> tuple[str, str]:
         """Parse a secret reference into (path, key).
@@ -172,12 +234,18 @@ class R2IndexHook(BaseHook):
             secrets: Mapping of config key to secret reference (path#key format)
             namespace: OpenBao namespace to use
         """
-        from airflow.providers.hashicorp.hooks.vault import VaultHook
-
         try:
             # Note: namespace should be configured in the Vault connection's extra field
-            vault_hook = VaultHook(vault_conn_id=vault_conn_id)
-            secret_cache: dict[str, dict[str, Any]] = {}
+            # Warm the per-path cache in parallel so N distinct paths cost one
+            # round trip of latency instead of N serial ones.
+            unique_paths = {
+                self._parse_secret_ref(ref, key)[0] for key, ref in secrets.items() if ref
+            }
+            if unique_paths:
+                with ThreadPoolExecutor(max_workers=min(8, len(unique_paths))) as executor:
+                    list(executor.map(
+                        lambda path: _read_vault_secret(vault_conn_id, path), unique_paths
+                    ))
 
             def get_secret_value(config_key: str) -> str | None:
                 secret_ref = secrets.get(config_key)
@@ -185,12 +253,7 @@ class R2IndexHook(BaseHook):
                     return None
 
                 path, key = self._parse_secret_ref(secret_ref, config_key)
-
-                if path not in secret_cache:
-                    data = vault_hook.get_secret(secret_path=path, secret_version=None)
-                    secret_cache[path] = data or {}
-
-                return secret_cache[path].get(key)
+                return _read_vault_secret(vault_conn_id, path).get(key)
 
             config = {
                 "index_api_url": get_secret_value("r2index_api_url"),
@@ -224,7 +287,7 @@ class R2IndexHook(BaseHook):
                 if not secrets_raw:
                     return None
                 if isinstance(secrets_raw, str):
-                    secrets = json.loads(secrets_raw)
+                    secrets = _json_loads(secrets_raw)
                 else:
                     secrets = secrets_raw
                 return self._get_config_from_vault(
@@ -245,24 +308,40 @@ class R2IndexHook(BaseHook):
             return None
 
     def get_conn(self) -> R2IndexClient:
-        """Get the R2IndexClient."""
-        if self._client is not None:
-            return self._client
+        """Get the R2IndexClient, shared across hook instances per conn_id."""
+        config = _resolve_config(self.r2index_conn_id)
+        config_key = frozenset(config.items())
+        entry = self._clients.get(self.r2index_conn_id)
+        if entry is not None:
+            if entry[0] == config_key:
+                return entry[1]
+            # Config rotated: close the superseded client before replacing it
+            try:
+                entry[1].close()
+            except Exception:
+                pass
 
         from elaunira.r2index import R2IndexClient
 
-        config = self._get_config_from_connection()
-        if config is None or not config.get("index_api_url"):
-            config = self._get_config_from_env()
-
-        self._client = R2IndexClient(
+        client = R2IndexClient(
             index_api_url=config["index_api_url"],
             index_api_token=config["index_api_token"],
             r2_access_key_id=config["r2_access_key_id"],
             r2_secret_access_key=config["r2_secret_access_key"],
             r2_endpoint_url=config["r2_endpoint_url"],
         )
-        return self._client
+        self._clients[self.r2index_conn_id] = (config_key, client)
+        return client
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled client; registered to run at interpreter exit."""
+        while cls._clients:
+            _, (_, client) = cls._clients.popitem()
+            try:
+                client.close()
+            except Exception:
+                pass
 
     def upload(
         self,
@@ -348,3 +427,6 @@ class R2IndexHook(BaseHook):
             limit=limit,
         )
         return response.model_dump()
+
+
+atexit.register(R2IndexHook.close_all)
@@ -9,6 +9,40 @@ from airflow.models import BaseOperatorLink
 if TYPE_CHECKING:
     from airflow.models.taskinstancekey import TaskInstanceKey
 
+# XCom values are immutable once a try has finished, so resolved file IDs are
+# memoized per ti_key; only hits are stored so an in-flight task whose XCom is
+# not yet written can still resolve on a later render. The cache is capped
+# (FIFO eviction) because the webserver process lives indefinitely.
+_FILE_ID_CACHE_MAX = 1024
+_file_id_cache: dict[TaskInstanceKey, str] = {}
+
+
+def _get_file_id(ti_key: TaskInstanceKey) -> str | None:
+    """Resolve the file ID from the task's XCom return value."""
+    file_id = _file_id_cache.get(ti_key)
+    if file_id is not None:
+        return file_id
+
+    from airflow.models import XCom
+
+    result = XCom.get_value(ti_key=ti_key, key="return_value")
+    # Operators return a list of records; link to the first one
+    if isinstance(result, list) and result:
+        result = result[0]
+    if not isinstance(result, dict):
+        return None
+
+    file_id = result.get("id")
+    if not file_id:
+        file_record = result.get("file_record")
+        if file_record:
+            file_id = file_record.get("id")
+    if file_id:
+        if len(_file_id_cache) >= _FILE_ID_CACHE_MAX:
+            _file_id_cache.pop(next(iter(_file_id_cache)))
+        _file_id_cache[ti_key] = file_id
+    return file_id
+
 
 class R2IndexFileLink(BaseOperatorLink):
     """
@@ -27,11 +61,7 @@ class R2IndexFileLink(BaseOperatorLink):
         ti_key: TaskInstanceKey,
     ) -> str:
         """Get the link to the R2Index file."""
-        from airflow.models import XCom
-
-        result = XCom.get_value(ti_key=ti_key, key="return_value")
-        if result and isinstance(result, dict):
-            file_id = result.get("id") or result.get("file_record", {}).get("id")
-            if file_id:
-                return f"https://r2index.elaunira.com/files/{file_id}"
+        file_id = _get_file_id(ti_key)
+        if file_id:
+            return f"https://r2index.elaunira.com/files/{file_id}"
         return ""
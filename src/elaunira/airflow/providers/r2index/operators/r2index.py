@@ -3,21 +3,178 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
 
-from elaunira.airflow.providers.r2index.hooks import R2IndexHook
 from elaunira.airflow.providers.r2index.links.r2index import R2IndexFileLink
-from elaunira.r2index import AsyncR2IndexClient
-from elaunira.r2index.storage import R2TransferConfig
 
 if TYPE_CHECKING:
+    import jinja2
     from airflow.utils.context import Context
 
+    from elaunira.r2index import AsyncR2IndexClient
+    from elaunira.r2index.storage import R2TransferConfig
+
+# Concurrency caps keep large fanouts from exhausting the httpx pool,
+# ephemeral ports, and R2's per-prefix request-rate limits.
+DEFAULT_MAX_CONCURRENT_UPLOADS = 32
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 64
+
+# Below this fanout, serializing records inline is cheaper than a thread hop.
+_DUMP_OFFLOAD_THRESHOLD = 4
+
+
+# Only these item fields routinely carry Jinja expressions; restricting the
+# traversal to them keeps schedule-time rendering from walking every
+# attribute of every item.
+_TEMPLATED_ITEM_FIELDS = (
+    "destination_path",
+    "destination_filename",
+    "destination_version",
+    "source_path",
+    "source_filename",
+    "source_version",
+)
+
+
+def _render_items(
+    items: list[Any], context: Context, jinja_env: jinja2.Environment
+) -> None:
+    """Render Jinja expressions on the items' templated string fields in place.
+
+    Compiled templates are cached by source string, so hundreds of items
+    sharing e.g. ``"{{ ds }}"`` compile once instead of once per item.
+    """
+    compiled: dict[str, jinja2.Template] = {}
+    for item in items:
+        for name in _TEMPLATED_ITEM_FIELDS:
+            value = getattr(item, name, None)
+            if not isinstance(value, str) or ("{{" not in value and "{%" not in value):
+                continue
+            template = compiled.get(value)
+            if template is None:
+                template = jinja_env.from_string(value)
+                compiled[value] = template
+            setattr(item, name, template.render(context))
+
+
+def _loop_factory() -> asyncio.AbstractEventLoop:
+    """Build the transfer event loop.
+
+    Prefers uvloop when installed; otherwise a stdlib loop with eager task
+    execution, where tasks start synchronously at create_task() time —
+    measurable on fanouts of hundreds.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+    else:
+        loop = uvloop.new_event_loop()
+    return loop
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide transfer event loop, creating it lazily."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = _loop_factory()
+        return _loop
+
+
+def _run(coro: Any) -> Any:
+    """Run a coroutine to completion on the persistent transfer loop.
+
+    Airflow runs one task at a time per worker process, so reusing a single
+    loop across operator invocations is safe and skips the loop + selector
+    setup that asyncio.run would pay on every execute().
+    """
+    return _get_loop().run_until_complete(coro)
+
+
+# Async clients shared across operator invocations on the persistent loop.
+# Each entry remembers the resolved config it was built from so a credential
+# rotation closes and replaces the client instead of stranding it.
+_shared_clients: dict[str, tuple[frozenset, Any]] = {}
+
+
+async def _shared_client(conn_id: str, config: dict[str, Any]) -> AsyncR2IndexClient:
+    """Return a pooled AsyncR2IndexClient for a conn_id's resolved config."""
+    from elaunira.r2index import AsyncR2IndexClient
+
+    config_key = frozenset(config.items())
+    entry = _shared_clients.get(conn_id)
+    if entry is not None:
+        if entry[0] == config_key:
+            return entry[1]
+        # Config rotated: close the superseded client before replacing it
+        await entry[1].__aexit__(None, None, None)
+
+    client = AsyncR2IndexClient(**config)
+    await client.__aenter__()
+    _shared_clients[conn_id] = (config_key, client)
+    return client
+
+
+def _close_shared_clients() -> None:
+    """Close pooled async clients; registered to run at interpreter exit."""
+    if _loop is None or _loop.is_closed() or not _shared_clients:
+        return
+    clients = [client for _, client in _shared_clients.values()]
+    _shared_clients.clear()
+
+    async def close_all() -> None:
+        # The gather must be built inside a coroutine already running on the
+        # persistent loop; at atexit time no loop is current, so building it
+        # eagerly would bind its futures to the wrong loop.
+        await asyncio.gather(*(client.__aexit__(None, None, None) for client in clients))
+
+    _loop.run_until_complete(close_all())
+
+
+atexit.register(_close_shared_clients)
+
+
+async def _head_existing(client: AsyncR2IndexClient, kwargs: dict[str, Any]) -> Any | None:
+    """Return the indexed record for an upload destination, if one exists.
+
+    Any failure (record not found, head unsupported by the server) is
+    treated as "not present" so the upload proceeds normally.
+    """
+    try:
+        return await client.head(
+            bucket=kwargs["bucket"],
+            destination_path=kwargs["destination_path"],
+            destination_filename=kwargs["destination_filename"],
+            destination_version=kwargs["destination_version"],
+        )
+    except Exception:
+        return None
+
+
+async def _dump_record(file_record: Any, *, offload: bool) -> dict[str, Any]:
+    """Serialize a Pydantic record, off the event loop for large fanouts.
+
+    model_dump() allocates a full dict tree on the loop thread; offloading
+    it to a worker thread overlaps serialization with in-flight transfers.
+    """
+    if offload:
+        return await asyncio.to_thread(file_record.model_dump)
+    return file_record.model_dump()
+
 
 
 @dataclass
@@ -51,9 +208,22 @@ class DownloadItem:
     bucket: str | None = None
     overwrite: bool = True
     r2index_conn_id: str | None = None
+    transfer_config: R2TransferConfig | None = None
     verify_checksum: bool = True
 
 
+# Item fields forwarded verbatim to the client, introspected once at import
+# time; bucket and r2index_conn_id are resolved against operator defaults.
+_UPLOAD_ITEM_FIELDS = tuple(
+    f.name for f in fields(UploadItem) if f.name not in ("bucket", "r2index_conn_id")
+)
+_DOWNLOAD_ITEM_FIELDS = tuple(
+    f.name
+    for f in fields(DownloadItem)
+    if f.name not in ("bucket", "r2index_conn_id", "transfer_config")
+)
+
+
 class R2IndexUploadOperator(BaseOperator):
     """
     Upload one or more files to R2 in parallel.
@@ -64,6 +234,11 @@ class R2IndexUploadOperator(BaseOperator):
     :param bucket: Default R2 bucket name (can be overridden per item).
     :param items: List of UploadItem or single UploadItem defining files to upload.
     :param r2index_conn_id: Default Airflow connection ID (can be overridden per item).
+    :param skip_if_exists: Skip items whose destination version is already
+        indexed, making idempotent DAG reruns nearly free on unchanged
+        inputs. Off by default: clearing a task after regenerating data
+        under the same destination_version must keep re-uploading, so only
+        enable this for destinations written exactly once per version.
     """
 
     template_fields: Sequence[str] = ("items",)
@@ -75,80 +250,118 @@ class R2IndexUploadOperator(BaseOperator):
         self,
         *,
         bucket: str,
-        items: list[UploadItem] | UploadItem,
+        items: list[UploadItem] | UploadItem | None = None,
         r2index_conn_id: str = "r2index_default",
+        skip_if_exists: bool = False,
         transfer_config: R2TransferConfig | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.bucket = bucket
-        self.items = [items] if isinstance(items, UploadItem) else items
+        if items is None:
+            # Deferred: decorated operators populate items at execute() time
+            self.items = []
+        elif isinstance(items, UploadItem):
+            self.items = [items]
+        else:
+            self.items = items
         self.r2index_conn_id = r2index_conn_id
+        self.skip_if_exists = skip_if_exists
         self.transfer_config = transfer_config
 
-
-
-    def _get_client_config(self, conn_id: str) -> dict[str, Any]:
-        """Get client configuration using the hook's priority chain."""
-        hook = R2IndexHook(r2index_conn_id=conn_id)
-        config = hook._get_config_from_connection()
-        if config is None or not config.get("index_api_url"):
-            config = hook._get_config_from_env()
-        return config or {}
+    def render_template_fields(
+        self, context: Context, jinja_env: jinja2.Environment | None = None
+    ) -> None:
+        """Render item templates without walking every item attribute."""
+        if jinja_env is None:
+            jinja_env = self.get_template_env()
+        if not isinstance(self.items, list):
+            # e.g. an XComArg from an upstream task; resolve it first
+            resolved = self.render_template(self.items, context, jinja_env, set())
+            self.items = [resolved] if isinstance(resolved, UploadItem) else resolved
+        _render_items(self.items, context, jinja_env)
+
+    def _prepare_upload_kwargs(self, item: UploadItem) -> dict[str, Any]:
+        """Build the client.upload keyword dict for one item."""
+        kwargs = {name: getattr(item, name) for name in _UPLOAD_ITEM_FIELDS}
+        kwargs["bucket"] = item.bucket or self.bucket
+        kwargs["transfer_config"] = self.transfer_config
+        return kwargs
 
     def execute(self, context: Context) -> list[dict[str, Any]]:
         """Execute the uploads in parallel."""
-        # Group items by connection ID for efficient client reuse
-        conn_configs: dict[str, dict[str, Any]] = {}
-
-        async def get_or_create_config(conn_id: str) -> dict[str, Any]:
-            if conn_id not in conn_configs:
-                conn_configs[conn_id] = self._get_client_config(conn_id)
-            return conn_configs[conn_id]
-
-        async def upload_one(item: UploadItem) -> dict[str, Any]:
-            conn_id = item.r2index_conn_id or self.r2index_conn_id
-            bucket = item.bucket or self.bucket
-            config = await get_or_create_config(conn_id)
-
-            try:
-                async with AsyncR2IndexClient(**config) as client:
-                    file_record = await client.upload(
-                        bucket=bucket,
-                        source=item.source,
-                        category=item.category,
-                        entity=item.entity,
-                        extension=item.extension,
-                        media_type=item.media_type,
-                        destination_path=item.destination_path,
-                        destination_filename=item.destination_filename,
-                        destination_version=item.destination_version,
-                        name=item.name,
-                        tags=item.tags,
-                        extra=item.extra,
-                        create_checksum_files=item.create_checksum_files,
-                        transfer_config=self.transfer_config,
-                    )
-                    return {"status": "success", "file_record": file_record.model_dump()}
-            except Exception as e:
-                return {"status": "error", "message": str(e), "source": item.source}
-
-        async def upload_all() -> list[dict[str, Any]]:
-            tasks = [upload_one(item) for item in self.items]
-            return await asyncio.gather(*tasks)
+        # Deferred import so DAG parsing does not pay for the hook module
+        from elaunira.airflow.providers.r2index.hooks.r2index import _resolve_config
+
+        sem = asyncio.Semaphore(
+            getattr(self.transfer_config, "max_concurrent_uploads", None)
+            or DEFAULT_MAX_CONCURRENT_UPLOADS
+        )
+        offload_dump = len(self.items) > _DUMP_OFFLOAD_THRESHOLD
+
+        async def upload_one(client: AsyncR2IndexClient, kwargs: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                if self.skip_if_exists:
+                    existing = await _head_existing(client, kwargs)
+                    if existing is not None:
+                        self.log.info(
+                            "Skipping %s: %s already indexed",
+                            kwargs["source"], kwargs["destination_filename"],
+                        )
+                        return await _dump_record(existing, offload=offload_dump)
+                file_record = await client.upload(**kwargs)
+            return await _dump_record(file_record, offload=offload_dump)
+
+        async def upload_all() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+            # Resolve per-item defaults once, outside the event loop's hot path
+            conn_ids = [item.r2index_conn_id or self.r2index_conn_id for item in self.items]
+            prepared = [self._prepare_upload_kwargs(item) for item in self.items]
+            total = len(prepared)
+
+            records: list[dict[str, Any]] = [None] * total  # type: ignore[list-item]
+            errors: list[dict[str, Any]] = []
+            done = 0
+
+            def log_progress(source: str, _task: asyncio.Future) -> None:
+                nonlocal done
+                done += 1
+                self.log.info("[%d/%d] finished %s", done, total, source)
+
+            # One pooled client per unique conn_id, shared by all items and
+            # kept open for later invocations on the persistent loop
+            clients = {
+                conn_id: await _shared_client(conn_id, _resolve_config(conn_id))
+                for conn_id in set(conn_ids)
+            }
+
+            tasks = []
+            for conn_id, kwargs in zip(conn_ids, prepared):
+                task = asyncio.ensure_future(upload_one(clients[conn_id], kwargs))
+                task.add_done_callback(partial(log_progress, kwargs["source"]))
+                tasks.append(task)
+
+            # upload_one raises on failure; classify success vs error in
+            # one indexed pass so real tracebacks reach the log.
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for idx, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    source = prepared[idx]["source"]
+                    self.log.error("Upload of %s failed", source, exc_info=result)
+                    errors.append({"source": source, "message": str(result)})
+                else:
+                    records[idx] = result
+            return records, errors
 
         self.log.info("::group::Upload progress")
-        results = asyncio.run(upload_all())
+        records, errors = _run(upload_all())
         self.log.info("::endgroup::")
 
-        # Check for errors
-        errors = [r for r in results if r.get("status") == "error"]
         if errors:
             self.log.error("Failed uploads: %s", errors)
-            raise AirflowException(f"{len(errors)}/{len(results)} uploads failed")
+            raise AirflowException(f"{len(errors)}/{len(self.items)} uploads failed")
 
-        self.log.info("Uploaded %d files in parallel", len(results))
-        return [r["file_record"] for r in results]
+        self.log.info("Uploaded %d files in parallel", len(records))
+        return records
 
 
 class R2IndexDownloadOperator(BaseOperator):
@@ -172,77 +385,108 @@ class R2IndexDownloadOperator(BaseOperator):
         self,
         *,
         bucket: str,
-        items: list[DownloadItem] | DownloadItem,
+        items: list[DownloadItem] | DownloadItem | None = None,
         r2index_conn_id: str = "r2index_default",
         transfer_config: R2TransferConfig | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.bucket = bucket
-        self.items = [items] if isinstance(items, DownloadItem) else items
+        if items is None:
+            # Deferred: decorated operators populate items at execute() time
+            self.items = []
+        elif isinstance(items, DownloadItem):
+            self.items = [items]
+        else:
+            self.items = items
         self.r2index_conn_id = r2index_conn_id
         self.transfer_config = transfer_config
 
-    def _get_client_config(self, conn_id: str) -> dict[str, Any]:
-        """Get client configuration using the hook's priority chain."""
-        hook = R2IndexHook(r2index_conn_id=conn_id)
-        config = hook._get_config_from_connection()
-        if config is None or not config.get("index_api_url"):
-            config = hook._get_config_from_env()
-        return config or {}
+    def render_template_fields(
+        self, context: Context, jinja_env: jinja2.Environment | None = None
+    ) -> None:
+        """Render item templates without walking every item attribute."""
+        if jinja_env is None:
+            jinja_env = self.get_template_env()
+        if not isinstance(self.items, list):
+            # e.g. an XComArg from an upstream task; resolve it first
+            resolved = self.render_template(self.items, context, jinja_env, set())
+            self.items = [resolved] if isinstance(resolved, DownloadItem) else resolved
+        _render_items(self.items, context, jinja_env)
+
+    def _prepare_download_kwargs(self, item: DownloadItem) -> dict[str, Any]:
+        """Build the client.download keyword dict for one item."""
+        kwargs = {name: getattr(item, name) for name in _DOWNLOAD_ITEM_FIELDS}
+        kwargs["bucket"] = item.bucket or self.bucket
+        kwargs["transfer_config"] = item.transfer_config or self.transfer_config
+        return kwargs
 
     def execute(self, context: Context) -> list[dict[str, Any]]:
         """Execute the downloads in parallel."""
-        # Group items by connection ID for efficient client reuse
-        conn_configs: dict[str, dict[str, Any]] = {}
-
-        async def get_or_create_config(conn_id: str) -> dict[str, Any]:
-            if conn_id not in conn_configs:
-                conn_configs[conn_id] = self._get_client_config(conn_id)
-            return conn_configs[conn_id]
-
-        async def download_one(item: DownloadItem) -> dict[str, Any]:
-            conn_id = item.r2index_conn_id or self.r2index_conn_id
-            bucket = item.bucket or self.bucket
-            config = await get_or_create_config(conn_id)
-
-            try:
-                async with AsyncR2IndexClient(**config) as client:
-                    downloaded_path, file_record = await client.download(
-                        bucket=bucket,
-                        source_path=item.source_path,
-                        source_filename=item.source_filename,
-                        source_version=item.source_version,
-                        destination=item.destination,
-                        verify_checksum=item.verify_checksum,
-                        overwrite=item.overwrite,
-                        transfer_config=self.transfer_config,
-                    )
-                    return {
-                        "status": "success",
-                        "path": str(downloaded_path),
-                        "file_record": file_record.model_dump() if file_record else None,
-                    }
-            except Exception as e:
-                return {
-                    "status": "error",
-                    "message": str(e),
-                    "source_path": item.source_path,
-                }
-
-        async def download_all() -> list[dict[str, Any]]:
-            tasks = [download_one(item) for item in self.items]
-            return await asyncio.gather(*tasks)
+        # Deferred import so DAG parsing does not pay for the hook module
+        from elaunira.airflow.providers.r2index.hooks.r2index import _resolve_config
+
+        sem = asyncio.Semaphore(
+            getattr(self.transfer_config, "max_concurrent_downloads", None)
+            or DEFAULT_MAX_CONCURRENT_DOWNLOADS
+        )
+        offload_dump = len(self.items) > _DUMP_OFFLOAD_THRESHOLD
+
+        async def download_one(client: AsyncR2IndexClient, kwargs: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                downloaded_path, file_record = await client.download(**kwargs)
+            record = (
+                await _dump_record(file_record, offload=offload_dump) if file_record else None
+            )
+            return {"path": str(downloaded_path), "file_record": record}
+
+        async def download_all() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+            # Resolve per-item defaults once, outside the event loop's hot path
+            conn_ids = [item.r2index_conn_id or self.r2index_conn_id for item in self.items]
+            prepared = [self._prepare_download_kwargs(item) for item in self.items]
+            total = len(prepared)
+
+            records: list[dict[str, Any]] = [None] * total  # type: ignore[list-item]
+            errors: list[dict[str, Any]] = []
+            done = 0
+
+            def log_progress(source_path: str, _task: asyncio.Future) -> None:
+                nonlocal done
+                done += 1
+                self.log.info("[%d/%d] finished %s", done, total, source_path)
+
+            # One pooled client per unique conn_id, shared by all items and
+            # kept open for later invocations on the persistent loop
+            clients = {
+                conn_id: await _shared_client(conn_id, _resolve_config(conn_id))
+                for conn_id in set(conn_ids)
+            }
+
+            tasks = []
+            for conn_id, kwargs in zip(conn_ids, prepared):
+                task = asyncio.ensure_future(download_one(clients[conn_id], kwargs))
+                task.add_done_callback(partial(log_progress, kwargs["source_path"]))
+                tasks.append(task)
+
+            # download_one raises on failure; classify success vs error in
+            # one indexed pass so real tracebacks reach the log.
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for idx, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    source_path = prepared[idx]["source_path"]
+                    self.log.error("Download of %s failed", source_path, exc_info=result)
+                    errors.append({"source_path": source_path, "message": str(result)})
+                else:
+                    records[idx] = result
+            return records, errors
 
         self.log.info("::group::Download progress")
-        results = asyncio.run(download_all())
+        records, errors = _run(download_all())
         self.log.info("::endgroup::")
 
-        # Check for errors
-        errors = [r for r in results if r.get("status") == "error"]
         if errors:
             self.log.error("Failed downloads: %s", errors)
-            raise AirflowException(f"{len(errors)}/{len(results)} downloads failed")
+            raise AirflowException(f"{len(errors)}/{len(self.items)} downloads failed")
 
-        self.log.info("Downloaded %d files in parallel", len(results))
-        return [{"path": r["path"], "file_record": r["file_record"]} for r in results]
+        self.log.info("Downloaded %d files in parallel", len(records))
+        return records